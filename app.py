@@ -1,8 +1,9 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, stream_template, get_flashed_messages, request, redirect, url_for, flash, jsonify
 from datetime import datetime, date, timedelta
 from statistics import mean
 from collections import defaultdict
 from sqlalchemy import func, text, inspect
+from sqlalchemy.orm import load_only, selectinload, joinedload
 
 from config import SQLALCHEMY_DATABASE_URI, SECRET_KEY
 from models import db, Topic, Problem, Session, ResolveLog, bootstrap_defaults
@@ -52,6 +53,33 @@ def init_db():
 
 init_db()
 
+# Columns the list templates actually render; the Text blobs (notes, review_notes)
+# stay deferred so large pages don't pull them for every row.
+PROBLEM_LIST_COLUMNS = (
+    Problem.id, Problem.title, Problem.link, Problem.difficulty, Problem.tags,
+    Problem.topic_id, Problem.needs_review, Problem.review_priority,
+    Problem.next_review_date, Problem.created_at,
+)
+RESOLVE_SUMMARY_COLUMNS = (
+    ResolveLog.problem_id, ResolveLog.planned_date, ResolveLog.minutes_spent,
+    ResolveLog.outcome, ResolveLog.created_at,
+)
+
+def problem_list_query():
+    return Problem.query.options(
+        load_only(*PROBLEM_LIST_COLUMNS),
+        selectinload(Problem.resolve_logs).load_only(*RESOLVE_SUMMARY_COLUMNS),
+    )
+
+def topic_choices():
+    return Topic.query.options(load_only(Topic.id, Topic.name)).order_by(Topic.name).all()
+
+def stream_page(template_name, **context):
+    # The session cookie is sent before a streamed body renders, so flashes have
+    # to be popped here; base.html prefers flashed_messages when it is passed.
+    context["flashed_messages"] = get_flashed_messages(with_categories=True)
+    return stream_template(template_name, **context)
+
 @app.route('/')
 def index():
     total_minutes = db.session.query(func.coalesce(func.sum(Session.duration_minutes), 0)).scalar() or 0
@@ -112,8 +140,8 @@ def topics_delete(tid):
 
 @app.route('/problems')
 def problems_list():
-    problems = Problem.query.order_by(Problem.created_at.desc()).limit(500).all()
-    topics = Topic.query.order_by(Topic.name).all()
+    problems = problem_list_query().order_by(Problem.created_at.desc()).limit(500).all()
+    topics = topic_choices()
     resolve_summary = {}
     for p in problems:
         logs_sorted = sorted(p.resolve_logs, key=lambda r: ((r.planned_date or date.min), r.created_at), reverse=True)
@@ -162,7 +190,7 @@ def problems_list():
     }
     priorities = ["Low", "Normal", "High", "Critical"]
     review_queue_preview = [p for p in problems if p.needs_review][:5]
-    return render_template(
+    return stream_page(
         'problems.html',
         problems=problems,
         topics=topics,
@@ -176,7 +204,11 @@ def problems_list():
 
 @app.route('/reviews')
 def reviews_board():
-    problems = Problem.query.order_by(Problem.created_at.desc()).all()
+    problems = problem_list_query().order_by(Problem.created_at.desc()).all()
+    # review_notes is only shown for queued problems, so fetch just those.
+    review_notes = dict(
+        db.session.query(Problem.id, Problem.review_notes).filter(Problem.needs_review.is_(True)).all()
+    )
     resolve_logs = ResolveLog.query.order_by(ResolveLog.planned_date.desc(), ResolveLog.created_at.desc()).limit(400).all()
     resolve_history = []
     resolve_summary = {}
@@ -244,10 +276,11 @@ def reviews_board():
     priorities = ["Low", "Normal", "High", "Critical"]
     focus_id = request.args.get('problem_id', type=int)
     focus_problem = Problem.query.get(focus_id) if focus_id else None
-    return render_template(
+    return stream_page(
         'reviews.html',
         problems=problems,
         review_queue=review_queue,
+        review_notes=review_notes,
         resolve_logs=resolve_logs,
         resolve_history=resolve_history,
         resolve_summary=resolve_summary,
@@ -405,10 +438,14 @@ def resolve_update_outcome(rid):
 
 @app.route('/sessions')
 def sessions_list():
-    sessions = Session.query.order_by(Session.date.desc(), Session.id.desc()).limit(200).all()
-    topics = Topic.query.order_by(Topic.name).all()
-    problems = Problem.query.order_by(Problem.created_at.desc()).limit(200).all()
-    return render_template('sessions.html', sessions=sessions, topics=topics, problems=problems)
+    sessions = Session.query.options(
+        joinedload(Session.topic).load_only(Topic.name),
+        joinedload(Session.problem).load_only(Problem.title),
+    ).order_by(Session.date.desc(), Session.id.desc()).limit(200).all()
+    topics = topic_choices()
+    # The problem dropdown only needs id/title, so skip building ORM objects.
+    problems = db.session.query(Problem.id, Problem.title).order_by(Problem.created_at.desc()).limit(200).all()
+    return stream_page('sessions.html', sessions=sessions, topics=topics, problems=problems)
 
 @app.route('/sessions/new', methods=['POST'])
 def sessions_new():
@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from models import db, Topic, Problem, Session, ResolveLog
+
+
+def seed(app, count, offset=0):
+    with app.app_context():
+        topic = Topic.query.filter_by(name="Arrays").one()
+        for i in range(offset, offset + count):
+            problem = Problem(
+                title=f"Problem {i}",
+                notes=f"long notes {i}",
+                review_notes=f"review note {i}",
+                needs_review=(i % 2 == 0),
+                topic=topic if i % 3 else None,
+            )
+            db.session.add(problem)
+            db.session.add(ResolveLog(problem=problem, outcome="Solved", minutes_spent=30 + i))
+            db.session.add(ResolveLog(problem=problem, outcome="Solved", minutes_spent=20 + i))
+            db.session.add(Session(problem=problem, topic=topic, duration_minutes=i, approach_notes=f"approach {i}"))
+        db.session.commit()
+
+
+@contextmanager
+def capture_sql(app):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def fetch(client, app, url):
+    with capture_sql(app) as statements:
+        response = client.get(url)
+        body = response.get_data(as_text=True)
+    assert response.status_code == 200
+    return body, list(statements)
+
+
+@pytest.mark.parametrize("url", ["/problems", "/reviews", "/sessions"])
+def test_query_count_does_not_grow_with_rows(client, app, url):
+    seed(app, 5)
+    _, small = fetch(client, app, url)
+    seed(app, 20, offset=5)
+    _, large = fetch(client, app, url)
+    assert len(large) == len(small)
+    assert not any("problems.notes" in stmt for stmt in large)
+
+
+def test_problems_renders_projected_columns(client, app):
+    seed(app, 4)
+    body, _ = fetch(client, app, "/problems")
+    assert "Problem 3" in body
+    assert "Needs review" in body
+    assert "long notes" not in body
+
+
+def test_reviews_renders_queued_review_notes(client, app):
+    seed(app, 4)
+    body, _ = fetch(client, app, "/reviews")
+    assert "review note 0" in body
+    assert "review note 2" in body
+    assert "review note 1" not in body
+    assert "Problem 3" in body
+
+
+def test_sessions_renders_topic_and_problem_names(client, app):
+    seed(app, 3)
+    body, _ = fetch(client, app, "/sessions")
+    assert "<td>Arrays</td>" in body
+    assert "<td>Problem 2</td>" in body
+    assert "approach 1" in body
+
+
+@pytest.mark.parametrize("post_url, data, page, message", [
+    ("/problems/new", {"title": "Two Sum"}, "/problems", "Problem added"),
+    ("/sessions/new", {"duration_minutes": "10"}, "/sessions", "Session logged"),
+])
+def test_flash_shown_once_on_streamed_page(client, post_url, data, page, message):
+    client.post(post_url, data=data)
+    assert message in client.get(page).get_data(as_text=True)
+    assert message not in client.get(page).get_data(as_text=True)
+
+
+def test_flash_shown_once_on_reviews(client, app):
+    seed(app, 1)
+    with app.app_context():
+        problem_id = Problem.query.first().id
+    client.post("/problems/resolve", data={"problem_id": problem_id, "outcome": "Solved"})
+    assert "Resolve entry saved" in client.get("/reviews").get_data(as_text=True)
+    assert "Resolve entry saved" not in client.get("/reviews").get_data(as_text=True)